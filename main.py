@@ -1,12 +1,60 @@
+import os
+from pathlib import Path
+
+def cgroup_cpu_quota():
+    """Return the cgroup CPU quota as (quota, period) microseconds, or None if unlimited."""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        return None if quota == "max" else (int(quota), int(period))
+    except (OSError, ValueError):
+        pass
+    # cgroup v1 reports an unlimited quota as -1
+    try:
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        return (quota, period) if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+def container_cpu_count() -> int:
+    """Number of CPUs this process may use, honouring the cgroup v1/v2 CPU quota."""
+    count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, max(1, quota[0] // quota[1]))
+    return count
+
+# Size the TensorFlow/oneDNN/ONNX Runtime thread pools to the container's CPU
+# quota rather than the host's core count. These must be set before the ML
+# libraries are imported.
+INTRA_OP_THREADS = int(os.getenv("INTRA_OP_THREADS", container_cpu_count()))
+INTER_OP_THREADS = int(os.getenv("INTER_OP_THREADS", "2"))
+os.environ.setdefault("OMP_NUM_THREADS", str(INTRA_OP_THREADS))
+os.environ.setdefault("TF_ENABLE_ONEDNN_OPTS", "1")
+
 from fastapi import FastAPI, File, UploadFile, HTTPException, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import ORJSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
-from pathlib import Path
+from starlette.datastructures import Headers
+from typing import List, Optional
 from deepface import DeepFace
+from deepface.detectors import FaceDetector
+from deepface.extendedmodels import Emotion
+from cachetools import LRUCache
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
+import tensorflow as tf
+import onnxruntime as ort
+import numpy as np
+import cv2
+import asyncio
+import hashlib
+import io
 import logging
-import tempfile
-import os
+import threading
+
+tf.config.threading.set_intra_op_parallelism_threads(INTRA_OP_THREADS)
+tf.config.threading.set_inter_op_parallelism_threads(INTER_OP_THREADS)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,101 +64,389 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Face Emotion Detection API",
     description="API for detecting emotions from facial images using DeepFace",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Directory holding the UI page
+STATIC_DIR = Path(__file__).parent / "static"
+
 # Serve static files for UI (CSS, JS)
 #app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Supported image formats
 SUPPORTED_FORMATS = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"}
 
+# Uploads larger than this are rejected before they are decoded
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Face detector used in front of the emotion model. MTCNN is only worth its
+# cost on a GPU; CPU-only deployments fall back to the much faster OpenCV
+# cascade, trading a little recall for an order of magnitude less latency.
+DETECTOR_BACKEND = os.getenv("FACE_DETECTOR", "opencv")
+CPU_DETECTOR_BACKEND = "opencv"
+GPU_ONLY_DETECTORS = {"mtcnn"}
+
+# Input size expected by DeepFace's Emotion CNN, and the square canvas DeepFace
+# letterboxes face crops onto before shrinking them to that size
+EMOTION_INPUT_SIZE = (48, 48)
+FACE_CANVAS_SIZE = (224, 224)
+
+# Uploads are downscaled so their longest edge fits the detector's working size
+MAX_IMAGE_EDGE = int(os.getenv("MAX_IMAGE_EDGE", "640"))
+
+# cv2 JPEG decode flags that scale by 1/factor while decoding
+REDUCED_JPEG_READ_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# Optional ONNX exports of the Emotion model (see scripts/export_onnx.py). When
+# present they are served with ONNX Runtime instead of Keras. The INT8 model is
+# opt-in via EMOTION_ONNX_INT8 and only used on hosts without a GPU provider.
+MODELS_DIR = Path(__file__).parent / "models"
+EMOTION_ONNX_PATH = Path(os.getenv("EMOTION_ONNX_PATH", MODELS_DIR / "emotion.onnx"))
+EMOTION_INT8_ONNX_PATH = Path(os.getenv("EMOTION_INT8_ONNX_PATH", MODELS_DIR / "emotion.int8.onnx"))
+USE_INT8_EMOTION_MODEL = os.getenv("EMOTION_ONNX_INT8", "0") == "1"
+ONNX_PROVIDERS = ["TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider"]
+GPU_ONNX_PROVIDERS = {"TensorrtExecutionProvider", "CUDAExecutionProvider"}
+
+# Results for recently seen images, keyed by the SHA-256 of the upload bytes
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "1024"))
+result_cache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+result_cache_lock = threading.Lock()
+
+# Maximum number of images accepted by the batch endpoint
+MAX_BATCH_SIZE = 16
+
+# The shared detector is not thread-safe (OpenCV's cascade classifier mutates
+# its own state while detecting), so detection calls are serialized
+detector_lock = threading.Lock()
+
+# Bounded pool for decoding and inference, keeping blocking work off the event loop
+inference_executor = ThreadPoolExecutor(max_workers=INTRA_OP_THREADS, thread_name_prefix="inference")
+
+# Largest request body accepted per upload route, allowing for multipart framing
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+UPLOAD_BODY_LIMITS = {
+    "/analyze-emotion": MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+    "/analyze-emotion-batch": MAX_BATCH_SIZE * (MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES),
+}
+
+class SizeAndTypeMiddleware:
+    """Reject non-multipart or oversized uploads before the form parser sees them.
+
+    Content-Type and Content-Length are checked up front; bodies sent without
+    a length are counted as they stream in. Other routes pass straight through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        max_bytes = None
+        if scope["type"] == "http" and scope["method"] == "POST":
+            max_bytes = UPLOAD_BODY_LIMITS.get(scope["path"])
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+        too_large = f"Request body too large (max {max_bytes // (1024 * 1024)}MB)."
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").lower().startswith("multipart/form-data"):
+            response = ORJSONResponse({"detail": "Expected a multipart/form-data upload."}, status_code=415)
+            await response(scope, receive, send)
+            return
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            await ORJSONResponse({"detail": too_large}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    # Raised inside the form parser; FastAPI turns it into the 413 response
+                    raise HTTPException(status_code=413, detail=too_large)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(SizeAndTypeMiddleware)
+
+def select_emotion_onnx_path():
+    """Pick the ONNX Emotion model to serve, or None to fall back to Keras."""
+    has_gpu = bool(GPU_ONNX_PROVIDERS.intersection(ort.get_available_providers()))
+    if USE_INT8_EMOTION_MODEL and not has_gpu and EMOTION_INT8_ONNX_PATH.exists():
+        return EMOTION_INT8_ONNX_PATH
+    if EMOTION_ONNX_PATH.exists():
+        return EMOTION_ONNX_PATH
+    return None
+
+def load_emotion_session(model_path: Path):
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = INTRA_OP_THREADS
+    options.inter_op_num_threads = INTER_OP_THREADS
+    available = ort.get_available_providers()
+    providers = [provider for provider in ONNX_PROVIDERS if provider in available]
+    return ort.InferenceSession(str(model_path), options, providers=providers)
+
+@app.on_event("startup")
+def load_models():
+    # Build the models once per worker instead of lazily on the first request
+    backend = DETECTOR_BACKEND
+    if backend in GPU_ONLY_DETECTORS and not tf.config.list_physical_devices("GPU"):
+        logger.warning("No GPU available, using %s instead of %s", CPU_DETECTOR_BACKEND, backend)
+        backend = CPU_DETECTOR_BACKEND
+    app.state.emotion_model = None
+    app.state.emotion_session = None
+    onnx_path = select_emotion_onnx_path()
+    if onnx_path is not None:
+        app.state.emotion_session = load_emotion_session(onnx_path)
+        logger.info("Serving %s with %s", onnx_path.name, app.state.emotion_session.get_providers())
+    else:
+        app.state.emotion_model = DeepFace.build_model("Emotion")
+    app.state.detector_backend = backend
+    app.state.detector = FaceDetector.build_model(backend)
+    logger.info("Loaded Emotion model and %s face detector", backend)
+    warm_up_models()
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    inference_executor.shutdown(wait=False, cancel_futures=True)
+
+def warm_up_models():
+    # A dummy pass pays kernel compilation and autotuning costs at boot
+    # rather than on the first user request
+    predict_emotions(np.zeros((1, *EMOTION_INPUT_SIZE, 1), np.float32))
+    FaceDetector.detect_faces(app.state.detector, app.state.detector_backend, np.zeros((320, 320, 3), np.uint8))
+    logger.info("Warm-up inference complete")
+
 def validate_image_format(filename: str) -> bool:
-    return Path(filename).suffix.lower() in SUPPORTED_FORMATS
-
-def save_uploaded_file(upload_file: UploadFile) -> str:
-    suffix = Path(upload_file.filename).suffix.lower()
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-        tmp_file.write(upload_file.file.read())
-        return tmp_file.name
-
-def cleanup_temp_file(file_path: str):
-    if os.path.exists(file_path):
-        os.remove(file_path)
-
-def detect_emotion(image_path: str):
-    result = DeepFace.analyze(
-        img_path=image_path,
-        actions=['emotion'],
-        enforce_detection=True,
-        detector_backend='mtcnn'
+    dot = filename.rfind(".") if filename else -1
+    return dot >= 0 and filename[dot:].lower() in SUPPORTED_FORMATS
+
+def sniff_image_format(header: bytes) -> Optional[str]:
+    """Identify a supported image format from its leading magic bytes."""
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    if header.startswith((b"II*\x00", b"MM\x00*")):
+        return "tiff"
+    if header.startswith(b"BM"):
+        return "bmp"
+    return None
+
+async def read_upload(upload_file: UploadFile) -> bytes:
+    """Read an upload in chunks, aborting on a non-image header or once it exceeds MAX_UPLOAD_BYTES."""
+    chunks = []
+    total = 0
+    while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+        if not chunks and sniff_image_format(chunk) is None:
+            raise HTTPException(status_code=400, detail="Unsupported image format.")
+        total += len(chunk)
+        if total > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=f"File too large (max {MAX_UPLOAD_BYTES // (1024 * 1024)}MB).")
+        chunks.append(chunk)
+    if not chunks:
+        raise HTTPException(status_code=400, detail="Unsupported image format.")
+    return b"".join(chunks)
+
+def jpeg_read_flag(buf: bytes) -> int:
+    """Pick an imdecode flag that lets libjpeg-turbo shrink a large JPEG in the DCT domain.
+
+    The size comes from PIL, which only parses the header. The reduced flags
+    never go below MAX_IMAGE_EDGE, and downscale_image handles the rest.
+    """
+    try:
+        with Image.open(io.BytesIO(buf)) as header:
+            longest_edge = max(header.size)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return cv2.IMREAD_COLOR
+    return next(
+        (flag for factor, flag in REDUCED_JPEG_READ_FLAGS if longest_edge // factor >= MAX_IMAGE_EDGE),
+        cv2.IMREAD_COLOR
     )
-    emotions = result[0]['emotion'] if isinstance(result, list) else result['emotion']
-    dominant_emotion = max(emotions, key=emotions.get)
-    confidence = emotions[dominant_emotion]
-    level = max(1, min(int(round(confidence / 10)), 10))
-    return dominant_emotion, level
+
+def decode_image(buf: bytes) -> np.ndarray:
+    """Decode uploaded image bytes straight from memory into a BGR array."""
+    flag = jpeg_read_flag(buf) if sniff_image_format(buf) == "jpeg" else cv2.IMREAD_COLOR
+    img = cv2.imdecode(np.frombuffer(buf, np.uint8), flag)
+    if img is None:
+        raise HTTPException(status_code=400, detail="Invalid image file.")
+    return downscale_image(img)
+
+def downscale_image(img: np.ndarray) -> np.ndarray:
+    """Shrink the image so its longest edge is at most MAX_IMAGE_EDGE pixels."""
+    height, width = img.shape[:2]
+    longest_edge = max(height, width)
+    if longest_edge <= MAX_IMAGE_EDGE:
+        return img
+    scale = MAX_IMAGE_EDGE / longest_edge
+    resized = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    logger.info("Resized image from %dx%d to %dx%d", width, height, resized.shape[1], resized.shape[0])
+    return resized
+
+def get_cached_result(key: bytes):
+    with result_cache_lock:
+        return result_cache.get(key)
+
+def cache_result(key: bytes, result: tuple):
+    with result_cache_lock:
+        result_cache[key] = result
+
+def letterbox_face(face: np.ndarray) -> np.ndarray:
+    """Fit a face crop onto FACE_CANVAS_SIZE, padding with black to keep its aspect ratio."""
+    factor = min(FACE_CANVAS_SIZE[0] / face.shape[0], FACE_CANVAS_SIZE[1] / face.shape[1])
+    face = cv2.resize(face, (int(face.shape[1] * factor), int(face.shape[0] * factor)))
+    diff_0 = FACE_CANVAS_SIZE[0] - face.shape[0]
+    diff_1 = FACE_CANVAS_SIZE[1] - face.shape[1]
+    face = np.pad(
+        face,
+        ((diff_0 // 2, diff_0 - diff_0 // 2), (diff_1 // 2, diff_1 - diff_1 // 2), (0, 0)),
+        "constant"
+    )
+    if face.shape[:2] != FACE_CANVAS_SIZE:
+        face = cv2.resize(face, FACE_CANVAS_SIZE)
+    return face
+
+def preprocess_face(face: np.ndarray) -> np.ndarray:
+    """Convert a BGR face crop into the (48, 48, 1) input of the Emotion model.
+
+    Mirrors DeepFace.analyze: letterbox, scale to [0, 1], then grayscale
+    and resize, so predictions match the library's own pipeline.
+    """
+    face = letterbox_face(face).astype(np.float32) / 255.0
+    gray = cv2.cvtColor(face, cv2.COLOR_BGR2GRAY)
+    gray = cv2.resize(gray, EMOTION_INPUT_SIZE)
+    return gray[..., np.newaxis]
+
+def extract_faces(img: np.ndarray) -> List[dict]:
+    """Detect faces once, returning each BGR crop with its facial area and detector confidence."""
+    with detector_lock:
+        detections = FaceDetector.detect_faces(app.state.detector, app.state.detector_backend, img)
+    faces = []
+    for face, (x, y, w, h), confidence in detections:
+        if face.shape[0] > 0 and face.shape[1] > 0:
+            faces.append({
+                "face": face,
+                "facial_area": {"x": int(x), "y": int(y), "w": int(w), "h": int(h)},
+                "confidence": confidence
+            })
+    if not faces:
+        raise ValueError("Face could not be detected. Please confirm that the picture is a face photo.")
+    return faces
+
+def predict_emotions(faces: np.ndarray) -> List[tuple]:
+    """Run the Emotion model over a (N, 48, 48, 1) batch in a single forward pass."""
+    session = app.state.emotion_session
+    if session is not None:
+        predictions = session.run(None, {session.get_inputs()[0].name: faces})[0]
+    else:
+        predictions = app.state.emotion_model.predict(faces, batch_size=len(faces), verbose=0)
+    results = []
+    for scores in predictions:
+        total = scores.sum()
+        emotions = {label: 100 * float(scores[i]) / total for i, label in enumerate(Emotion.labels)}
+        dominant_emotion = max(emotions, key=emotions.get)
+        confidence = emotions[dominant_emotion]
+        level = max(1, min(int(round(confidence / 10)), 10))
+        results.append((dominant_emotion, level))
+    return results
+
+def classify_faces(faces: List[dict]) -> List[dict]:
+    """Add "emotion" and "level" to extracted face dicts using one stacked forward pass.
+
+    The crops and facial areas stay on each dict, so further analyses can
+    reuse them without running the detector again.
+    """
+    predictions = predict_emotions(np.stack([preprocess_face(face["face"]) for face in faces]))
+    for face, (emotion, level) in zip(faces, predictions):
+        face["emotion"] = emotion
+        face["level"] = level
+    return faces
+
+def analyze_face(img: np.ndarray) -> dict:
+    """Detect and classify the first face in the image."""
+    return classify_faces(extract_faces(img)[:1])[0]
+
+def detect_emotion(img: np.ndarray):
+    face = analyze_face(img)
+    return face["emotion"], face["level"]
+
+def extract_faces_in_upload(buf: bytes) -> List[dict]:
+    return extract_faces(decode_image(buf))
+
+def detect_emotion_in_upload(buf: bytes):
+    return detect_emotion(decode_image(buf))
+
+async def run_in_executor(func, *args):
+    """Run blocking decode/inference work on the bounded inference pool."""
+    return await asyncio.get_running_loop().run_in_executor(inference_executor, func, *args)
 
 # --- UI Route ---
-@app.get("/", response_class=HTMLResponse)
+@app.get("/", response_class=FileResponse)
 async def home():
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Face Emotion Detection</title>
-        <style>
-            body { font-family: Arial, sans-serif; max-width: 600px; margin: auto; padding: 20px; }
-            h1 { text-align: center; }
-            input[type=file] { display: block; margin: 20px 0; }
-            button { padding: 10px 20px; }
-            #result { margin-top: 20px; font-weight: bold; }
-        </style>
-    </head>
-    <body>
-        <h1>Face Emotion Detection</h1>
-        <form id="uploadForm">
-            <input type="file" id="fileInput" name="file" accept="image/*" required>
-            <button type="submit">Detect Emotion</button>
-        </form>
-        <div id="result"></div>
-        <script>
-            const form = document.getElementById('uploadForm');
-            form.addEventListener('submit', async (e) => {
-                e.preventDefault();
-                const fileInput = document.getElementById('fileInput');
-                const file = fileInput.files[0];
-                const formData = new FormData();
-                formData.append('file', file);
-                const resultDiv = document.getElementById('result');
-                resultDiv.textContent = 'Analyzing...';
-                try {
-                    const response = await fetch('/analyze-emotion', { method: 'POST', body: formData });
-                    const data = await response.json();
-                    resultDiv.textContent = `Detected Emotion: ${data.emotion}, Level: ${data.level}`;
-                } catch (err) {
-                    resultDiv.textContent = 'Error detecting emotion.';
-                }
-            });
-        </script>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+    return FileResponse(STATIC_DIR / "index.html", headers={"Cache-Control": "public, max-age=3600"})
 
 # --- API Route ---
 @app.post("/analyze-emotion")
 async def analyze_emotion(file: UploadFile = File(...)):
-    temp_file_path = None
-    try:
+    if not validate_image_format(file.filename):
+        raise HTTPException(status_code=400, detail="Unsupported image format.")
+    buf = await read_upload(file)
+    key = hashlib.sha256(buf).digest()
+    cached = get_cached_result(key)
+    if cached is not None:
+        emotion, level = cached
+        return {"emotion": emotion, "level": level}
+    emotion, level = await run_in_executor(detect_emotion_in_upload, buf)
+    cache_result(key, (emotion, level))
+    return {"emotion": emotion, "level": level}
+
+@app.post("/analyze-emotion-batch")
+async def analyze_emotion_batch(files: List[UploadFile] = File(...)):
+    if len(files) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} images per batch.")
+    for file in files:
         if not validate_image_format(file.filename):
-            raise HTTPException(status_code=400, detail="Unsupported image format.")
-        temp_file_path = save_uploaded_file(file)
-        emotion, level = detect_emotion(temp_file_path)
-        return JSONResponse({"emotion": emotion, "level": level})
-    finally:
-        if temp_file_path:
-            cleanup_temp_file(temp_file_path)
+            raise HTTPException(status_code=400, detail=f"Unsupported image format: {file.filename}")
+    buffers = [await read_upload(file) for file in files]
+    keys = [hashlib.sha256(buf).digest() for buf in buffers]
+    results = [get_cached_result(key) for key in keys]
+    pending = [i for i, result in enumerate(results) if result is None]
+    detections = await asyncio.gather(
+        *(run_in_executor(extract_faces_in_upload, buffers[i]) for i in pending),
+        return_exceptions=True
+    )
+    for faces in detections:
+        if isinstance(faces, Exception) and not isinstance(faces, ValueError):
+            raise faces
+    errors = {i: str(faces) for i, faces in zip(pending, detections) if isinstance(faces, ValueError)}
+    detected = [(i, faces[0]) for i, faces in zip(pending, detections) if i not in errors]
+    if detected:
+        classified = await run_in_executor(classify_faces, [face for _, face in detected])
+        for (i, _), face in zip(detected, classified):
+            result = (face["emotion"], face["level"])
+            cache_result(keys[i], result)
+            results[i] = result
+    response = []
+    for i, file in enumerate(files):
+        if i in errors:
+            response.append({"filename": file.filename, "error": errors[i]})
+        else:
+            emotion, level = results[i]
+            response.append({"filename": file.filename, "emotion": emotion, "level": level})
+    return {"results": response}
 
 @app.get("/health")
 async def health_check():
@@ -118,4 +454,12 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # One worker per GPU so each process owns its models and CUDA context
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1"))
+    )
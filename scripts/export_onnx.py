@@ -0,0 +1,50 @@
+"""
+Export DeepFace's Emotion model to ONNX for serving with ONNX Runtime.
+Run this once at build time; the API loads models/emotion.onnx on startup,
+or models/emotion.int8.onnx on CPU-only hosts when --quantize was used and
+EMOTION_ONNX_INT8=1 is set.
+
+Requires tf2onnx: pip install tf2onnx
+"""
+
+import argparse
+from pathlib import Path
+
+import tensorflow as tf
+import tf2onnx
+from deepface import DeepFace
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
+
+def export_emotion_model(output_path: Path):
+    """Convert the Keras Emotion model to ONNX with a dynamic batch dimension."""
+    model = DeepFace.build_model("Emotion")
+    input_signature = (tf.TensorSpec((None, 48, 48, 1), tf.float32, name="input"),)
+    tf2onnx.convert.from_keras(model, input_signature=input_signature, opset=13, output_path=str(output_path))
+    print(f"✅ Exported Emotion model to {output_path}")
+
+def quantize_emotion_model(model_path: Path, output_path: Path):
+    """Write a copy of the exported model with INT8 weights in its dense layers.
+
+    Conv layers stay FP32: dynamic quantization turns them into ConvInteger,
+    which is often slower than FP32 Conv on the CPU execution provider.
+    """
+    quantize_dynamic(
+        str(model_path),
+        str(output_path),
+        op_types_to_quantize=["MatMul", "Gemm"],
+        weight_type=QuantType.QInt8
+    )
+    print(f"✅ Quantized Emotion model to {output_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=MODELS_DIR / "emotion.onnx")
+    parser.add_argument("--quantize", action="store_true", help="also write an INT8 model next to the output")
+    args = parser.parse_args()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    export_emotion_model(args.output)
+    if args.quantize:
+        quantize_emotion_model(args.output, args.output.with_suffix(".int8.onnx"))
@@ -5,11 +5,28 @@ Run this after starting the FastAPI server to test the endpoints.
 
 import requests
 import json
+import struct
+import zlib
 from pathlib import Path
 
 # API base URL (adjust if running on different host/port)
 BASE_URL = "http://localhost:8000"
 
+# Must match MAX_BATCH_SIZE in main.py
+MAX_BATCH_SIZE = 16
+
+def make_blank_png(width=64, height=64):
+    """Build a solid grey PNG in memory, used as an image with no face in it."""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    rows = b"".join(b"\x00" + b"\x80" * (width * 3) for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
 def test_health_endpoint():
     """Test the health check endpoint."""
     print("Testing health endpoint...")
@@ -33,16 +50,35 @@ def test_root_endpoint():
         print(f"❌ Root endpoint failed: {e}\n")
 
 def test_emotion_analysis_no_file():
-    """Test emotion analysis endpoint without file."""
+    """Test emotion analysis endpoint without file (rejected as non-multipart)."""
     print("Testing emotion analysis without file...")
     try:
         response = requests.post(f"{BASE_URL}/analyze-emotion")
         print(f"Status: {response.status_code}")
         print(f"Response: {response.json()}")
-        print("✅ Error handling working (no file)\n")
+        if response.status_code == 415:
+            print("✅ Error handling working (no file)\n")
+        else:
+            print("⚠️ Expected 415 for a request without a multipart body\n")
     except Exception as e:
         print(f"❌ No file test failed: {e}\n")
 
+def test_emotion_analysis_too_large():
+    """Test that uploads over the 10MB limit are rejected with 413."""
+    print("Testing emotion analysis with an oversized file...")
+    payload = b"\xff\xd8\xff" + b"\x00" * (11 * 1024 * 1024)
+    try:
+        files = {"file": ("large.jpg", payload, "image/jpeg")}
+        response = requests.post(f"{BASE_URL}/analyze-emotion", files=files)
+        print(f"Status: {response.status_code}")
+        print(f"Response: {response.json()}")
+        if response.status_code == 413:
+            print("✅ Size limit working\n")
+        else:
+            print("⚠️ Expected 413 for an oversized upload\n")
+    except Exception as e:
+        print(f"❌ Oversized file test failed: {e}\n")
+
 def test_emotion_analysis_with_sample():
     """Test emotion analysis with a sample image (if available)."""
     print("Testing emotion analysis with sample image...")
@@ -68,6 +104,43 @@ def test_emotion_analysis_with_sample():
     except Exception as e:
         print(f"❌ Emotion analysis test failed: {e}\n")
 
+def test_batch_analysis():
+    """Test the batch endpoint, including the per-item error for an image without a face."""
+    print("Testing batch emotion analysis...")
+    files = [("files", ("blank.png", make_blank_png(), "image/png"))]
+    sample_file = Path("sample_face.jpg")
+    if sample_file.exists():
+        files.insert(0, ("files", ("sample_face.jpg", sample_file.read_bytes(), "image/jpeg")))
+    else:
+        print("⚠️ No sample image found, only checking the no-face entry")
+    try:
+        response = requests.post(f"{BASE_URL}/analyze-emotion-batch", files=files)
+        print(f"Status: {response.status_code}")
+        print(f"Response: {response.json()}")
+        results = response.json().get("results", [])
+        if response.status_code == 200 and len(results) == len(files) and "error" in results[-1]:
+            print("✅ Batch analysis working\n")
+        else:
+            print("⚠️ Batch analysis returned unexpected results\n")
+    except Exception as e:
+        print(f"❌ Batch analysis test failed: {e}\n")
+
+def test_batch_analysis_too_many_files():
+    """Test that the batch endpoint rejects more than MAX_BATCH_SIZE images."""
+    print("Testing batch emotion analysis with too many files...")
+    blank = make_blank_png()
+    files = [("files", (f"blank{i}.png", blank, "image/png")) for i in range(MAX_BATCH_SIZE + 1)]
+    try:
+        response = requests.post(f"{BASE_URL}/analyze-emotion-batch", files=files)
+        print(f"Status: {response.status_code}")
+        print(f"Response: {response.json()}")
+        if response.status_code == 400:
+            print("✅ Batch size limit working\n")
+        else:
+            print("⚠️ Expected 400 for an oversized batch\n")
+    except Exception as e:
+        print(f"❌ Batch size test failed: {e}\n")
+
 if __name__ == "__main__":
     print("🧪 Testing Face Emotion Detection API\n")
     print("Make sure the FastAPI server is running on http://localhost:8000\n")
@@ -75,7 +148,10 @@ if __name__ == "__main__":
     test_health_endpoint()
     test_root_endpoint()
     test_emotion_analysis_no_file()
+    test_emotion_analysis_too_large()
     test_emotion_analysis_with_sample()
+    test_batch_analysis()
+    test_batch_analysis_too_many_files()
     
     print("🏁 Testing complete!")
     print("\n📖 To test manually, visit: http://localhost:8000/docs")